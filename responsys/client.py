@@ -1,11 +1,19 @@
+import asyncio
 import logging
+import threading
+from collections import namedtuple
+from functools import partial, wraps
 from ssl import SSLError
 from time import time
+from types import MappingProxyType
 from urllib.error import URLError
 
+from requests import RequestException
+from suds.cache import ObjectCache
 from suds.client import Client
 from suds import WebFault
 
+from .transport import PooledTransport
 from .exceptions import (
     ConnectError, ServiceError, AccountFault, ApiLimitError, TableFault, ListFault)
 from .types import (
@@ -15,6 +23,39 @@ from .types import (
 log = logging.getLogger(__name__)
 
 
+class Session(namedtuple('Session', ('id', 'start'))):
+
+    """ Id and start time of an Interact session
+
+    Expiry is checked against the current lifetime returned by the getter provided, so changing the
+    session lifetime of a client also affects its open session.
+    """
+
+    def __new__(cls, id_, start, lifetime):
+        session = super().__new__(cls, id_, start)
+        session._lifetime = lifetime
+        return session
+
+    @property
+    def is_expired(self):
+        return self.start + self._lifetime() <= time()
+
+
+# One connection pool shared by all InteractClient instances, each keeping its own cookies
+_http_adapter = PooledTransport.create_adapter()
+
+
+def _wrap_results(result_type, result):
+    """ Wraps each result of a reply in result_type
+
+    suds returns a list for repeated elements and the object itself for a single one. suds objects
+    define __iter__, so the type is checked rather than iterability.
+    """
+    if isinstance(result, (list, tuple)):
+        return [result_type(item) for item in result]
+    return [result_type(result)]
+
+
 class InteractClient(object):
 
     """ Interact Client Class
@@ -36,34 +77,45 @@ class InteractClient(object):
     don't leave unused connections open.
     """
     DEFAULT_SESSION_LIFETIME = 60 * 10
-    WSDLS = {
+    WSDL_CACHE_DAYS = 7
+    WSDLS = MappingProxyType({
         '2': 'https://ws2.responsys.net/webservices/wsdl/ResponsysWS_Level1.wsdl',
         '5': 'https://ws5.responsys.net/webservices/wsdl/ResponsysWS_Level1.wsdl',
         'rtm4': 'https://rtm4.responsys.net/tmws/services/TriggeredMessageWS?wsdl',
         'rtm4b': 'https://rtm4b.responsys.net/tmws/services/TriggeredMessageWS?wsdl',
-    }
+    })
 
-    ENDPOINTS = {
+    ENDPOINTS = MappingProxyType({
         '2': 'https://ws2.responsys.net/webservices/services/ResponsysWSService',
         '5': 'https://ws5.responsys.net/webservices/services/ResponsysWSService',
         'rtm4': 'http://rtm4.responsys.net:80/tmws/services/TriggeredMessageWS',
         'rtm4b': 'http://rtm4b.responsys.net:80/tmws/services/TriggeredMessageWS',
-    }
-
-    @property
-    def wsdl(self):
-        return self.WSDLS[self.pod]
+    })
 
-    @property
-    def endpoint(self):
-        return self.ENDPOINTS[self.pod]
+    FAULTS = MappingProxyType({
+        'TableFault': TableFault,
+        'ListFault': ListFault,
+        'API_LIMIT_EXCEEDED': ApiLimitError,
+        'AccountFault': AccountFault,
+    })
 
     @property
     def client(self):
         if self._client is None:
-            self._client = Client(self.wsdl, location=self.endpoint, timeout=self.timeout)
+            self._client = self._create_client()
         return self._client
 
+    @property
+    def xml_client(self):
+        """ Client for the pod that returns reply xml as-is, skipping suds' unmarshalling
+
+        Built from the pod WSDL even when a client was passed to init.
+        """
+        if self._xml_client is None:
+            soapheaders = self._session_header if self.session else ()
+            self._xml_client = self._create_client(retxml=True, soapheaders=soapheaders)
+        return self._xml_client
+
     @property
     def connected(self):
         return getattr(self, '_connected', False)
@@ -78,27 +130,34 @@ class InteractClient(object):
 
     @session.setter
     def session(self, session_id):
-        self._session = type(
-            'Session', (tuple,), {
-                'is_expired': property(lambda s: s[1] + self.session_lifetime <= time()),
-        })([session_id, time()])
+        self._session = Session(session_id, time(), lambda: self.session_lifetime)
 
-        session_header = self.client.factory.create('SessionHeader')
-        session_header.sessionId = session_id
-        self.client.set_options(soapheaders=session_header)
+        # Built once, suds marshals soapheaders on every send so updating the id is enough
+        if self._session_header is None:
+            self._session_header = self.client.factory.create('SessionHeader')
+        self._session_header.sessionId = session_id
+        self._set_soapheaders(self._session_header)
 
     @session.deleter
     def session(self):
         self._session = None
-        self.client.set_options(soapheaders=())
+        self._set_soapheaders(())
 
-    def __init__(self, username, password, pod, client=None, session_lifetime=600, timeout=5):
+    def __init__(self, username, password, pod, client=None, session_lifetime=600, timeout=5,
+                 cache_dir=None):
         self.username = username
         self.password = password
         self.pod = pod
+        self.wsdl = self.WSDLS[pod]
+        self.endpoint = self.ENDPOINTS[pod]
         self.session_lifetime = session_lifetime
         self.timeout = timeout
+        self.cache_dir = cache_dir
         self._client = client
+        self._xml_client = None
+        self._http_session = PooledTransport.create_session(_http_adapter)
+        self._session_header = None
+        self._operations = {}
 
     def __enter__(self):
         self.connect()
@@ -107,27 +166,48 @@ class InteractClient(object):
     def __exit__(self, type_, value, traceback):
         self.disconnect()
 
-    def call(self, method, *args):
-        """ Calls the service method defined with the arguments provided """
+    def _create_client(self, **options):
+        # Each instance has its own clients, so their own options (soapheaders, timeout).
+        # cachingpolicy=1 caches the parsed (pickled) WSDL rather than the raw documents, so every
+        # client after the first, in this process or later ones, skips parsing it.
+        cache = ObjectCache(location=self.cache_dir, days=self.WSDL_CACHE_DAYS)
+        return Client(
+            self.wsdl, location=self.endpoint, transport=PooledTransport(self._http_session),
+            cache=cache, cachingpolicy=1, timeout=self.timeout, **options)
+
+    def _set_soapheaders(self, soapheaders):
+        self.client.set_options(soapheaders=soapheaders)
+        if self._xml_client is not None:
+            self._xml_client.set_options(soapheaders=soapheaders)
+
+    def call(self, method, *args, retxml=False):
+        """ Calls the service method defined with the arguments provided
+
+        Returns the reply xml instead of the unmarshalled result when retxml is True.
+        """
+        # suds resolves the service, port and method on each attribute lookup, so the resulting
+        # callable is kept for later calls
+        operation = self._operations.get((method, retxml))
+        if operation is None:
+            client = self.xml_client if retxml else self.client
+            operation = self._operations[method, retxml] = getattr(client.service, method)
+
         try:
-            response = getattr(self.client.service, method)(*args)
-        except (URLError, SSLError) as e:
+            response = operation(*args)
+        except (URLError, SSLError, RequestException) as e:
             log.exception('Failed to connect to responsys service')
             raise ConnectError("Request to service timed out")
         except WebFault as web_fault:
             fault_name = getattr(web_fault.fault, 'faultstring', None)
-            error = str(web_fault.fault.detail)
-
-            if fault_name == 'TableFault':
-                raise TableFault(error)
-            if fault_name == 'ListFault':
-                raise ListFault(error)
-            if fault_name == 'API_LIMIT_EXCEEDED':
-                raise ApiLimitError(error)
-            if fault_name == 'AccountFault':
-                raise AccountFault(error)
+            fault = self.FAULTS.get(fault_name)
+            if fault is not None:
+                raise fault(str(web_fault.fault.detail))
 
             raise ServiceError(web_fault.fault, web_fault.document)
+        finally:
+            if retxml:
+                # suds keeps the last reply, which for retxml calls can be large
+                self.xml_client.messages['rx'] = None
         return response
 
     def connect(self):
@@ -136,6 +216,8 @@ class InteractClient(object):
         Uses the credentials passed to the client init to login and setup the session id returned.
         Returns True on successful connection, otherwise False.
         """
+        if self.connected and self.session and not self.session.is_expired:
+            return self.connected
 
         if self.session and self.session.is_expired:
             # Close the session to avoid max concurrent session errors
@@ -244,9 +326,7 @@ class InteractClient(object):
         """
         list_ = list_.get_soap_object(self.client)
         result = self.call('deleteListMembers', list_, query_column, ids_to_delete)
-        if hasattr(result, '__iter__'):
-            return [DeleteResult(delete_result) for delete_result in result]
-        return [DeleteResult(result)]
+        return _wrap_results(DeleteResult, result)
 
     def retrieve_list_members(self, list_, query_column, field_list, ids_to_retrieve):
         """ Responsys.retrieveListMembers call
@@ -261,8 +341,22 @@ class InteractClient(object):
         Returns a RecordData instance
         """
         list_ = list_.get_soap_object(self.client)
-        result = self.call('retrieveListMembers', list_, query_column, field_list, ids_to_retrieve)
-        return RecordData.from_soap_type(result.recordData)
+        return RecordData.from_xml(self.call(
+            'retrieveListMembers', list_, query_column, field_list, ids_to_retrieve,
+            retxml=True))
+
+    def retrieve_list_members_iter(self, list_, query_column, field_list, ids_to_retrieve):
+        """ Responsys.retrieveListMembers call, streaming the records retrieved
+
+        Accepts the same arguments as retrieve_list_members.
+
+        Returns an iterator of dictionaries mapping field names to values, one per record. Records
+        are parsed from the reply as they are consumed rather than built into a RecordData.
+        """
+        list_ = list_.get_soap_object(self.client)
+        return RecordData.iter_xml(self.call(
+            'retrieveListMembers', list_, query_column, field_list, ids_to_retrieve,
+            retxml=True))
 
     # Table Management Methods
     def create_table(self, table, fields):
@@ -316,9 +410,7 @@ class InteractClient(object):
         profile_extension = profile_extension.get_soap_object(self.client)
         result = self.call(
             'deleteProfileExtensionMembers', profile_extension, query_column, ids_to_delete)
-        if hasattr(result, '__iter__'):
-            return [DeleteResult(delete_result) for delete_result in result]
-        return [DeleteResult(result)]
+        return _wrap_results(DeleteResult, result)
 
     def retrieve_profile_extension_records(self, profile_extension, field_list, ids_to_retrieve,
                                            query_column='RIID'):
@@ -334,9 +426,9 @@ class InteractClient(object):
         Returns RecordData
         """
         profile_extension = profile_extension.get_soap_object(self.client)
-        return RecordData.from_soap_type(
+        return RecordData.from_xml(
             self.call('retrieveProfileExtensionRecords',
-                      profile_extension, query_column, field_list, ids_to_retrieve))
+                      profile_extension, query_column, field_list, ids_to_retrieve, retxml=True))
 
     def truncate_table(self, table):
         """ Responsys.truncateTable call
@@ -362,9 +454,7 @@ class InteractClient(object):
         """
         table = table.get_soap_object(self.client)
         result = self.call('deleteTableRecords', table, query_column, ids_to_delete)
-        if hasattr(result, '__iter__'):
-            return [DeleteResult(delete_result) for delete_result in result]
-        return [DeleteResult(result)]
+        return _wrap_results(DeleteResult, result)
 
     def merge_table_records(self, table, record_data, match_column_names):
         """ Responsys.mergeTableRecords call
@@ -430,8 +520,8 @@ class InteractClient(object):
         Returns a RecordData
         """
         table = table.get_soap_object(self.client)
-        return RecordData.from_soap_type(self.call(
-            'retrieveTableRecords', table, query_column, field_list, ids_to_retrieve))
+        return RecordData.from_xml(self.call(
+            'retrieveTableRecords', table, query_column, field_list, ids_to_retrieve, retxml=True))
 
     # Campaign Management Methods
     # TODO: implement
@@ -440,10 +530,28 @@ class InteractClient(object):
     # MergeTriggerEmail
     # ScheduleCampaignLaunch
     # TriggerCampaignMessage
-    def trigger_custom_event(self, custom_event, recipient_data=None):
+    def trigger_custom_event(self, custom_event, recipient_data=None, batch_size=None):
+        """ Responsys.triggerCustomEvent call
+
+        Accepts:
+            CustomEvent custom_event
+            list recipient_data
+                list of RecipientData
+            int batch_size
+                when given, recipients are sent batch_size per call. Calls are not atomic, a
+                failed call raises without the results of the calls made before it.
+
+        Returns a list of TriggerResult
+        """
         custom_event = custom_event.get_soap_object(self.client)
         recipient_data = [rdata.get_soap_object(self.client) for rdata in recipient_data]
-        results = self.call('triggerCustomEvent', custom_event, recipient_data)
+        if batch_size is None or len(recipient_data) <= batch_size:
+            results = self.call('triggerCustomEvent', custom_event, recipient_data)
+        else:
+            results = []
+            for start in range(0, len(recipient_data), batch_size):
+                batch = recipient_data[start:start + batch_size]
+                results.extend(self.call('triggerCustomEvent', custom_event, batch))
         return [TriggerResult(result) for result in results]
 
 
@@ -451,3 +559,108 @@ class InteractClient(object):
     #
     # Content Management Methods
     # Folder Management Methods
+
+
+def _run_in_executor(name, shared=False):
+    """ Wraps the named InteractClient method in a coroutine that runs it in an executor
+
+    Shared methods run on the InteractClient shared by all threads, others on the InteractClient
+    of the executor thread.
+    """
+    @wraps(getattr(InteractClient, name))
+    async def run_in_executor(self, *args, **kwargs):
+        call = self._call_shared if shared else self._call
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(call, name, *args, **kwargs))
+    return run_in_executor
+
+
+class AsyncInteractClient(object):
+
+    """ Async Interact Client Class
+
+    Provides the InteractClient methods as coroutines, so a single event loop can have many
+    Responsys calls in flight at once:
+
+        >>> async with AsyncInteractClient(username, password, pod) as client:
+        ...     await asyncio.gather(
+        ...         client.merge_list_members(interact_object, records, merge_rules),
+        ...         client.retrieve_list_members(interact_object, query_column, fields, ids))
+
+    suds is blocking, so each call runs on a thread of the executor provided (the loop's default
+    executor when None). suds clients are not thread-safe, replies can be returned to the wrong
+    caller, so each thread calls through an InteractClient of its own using the session of the
+    shared client, interact. Session management methods run on the shared client, one at a time.
+    Arguments other than executor are passed to InteractClient, a suds client passed in is only
+    used by the shared client.
+    """
+
+    def __init__(self, *args, executor=None, **kwargs):
+        self.interact = InteractClient(*args, **kwargs)
+        self.executor = executor
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._args = args
+        self._kwargs = dict(kwargs, client=None)
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, type_, value, traceback):
+        await self.disconnect()
+
+    def _thread_interact(self):
+        """ InteractClient of the current thread, using the session of the shared client """
+        interact = getattr(self._local, 'interact', None)
+        if interact is None:
+            interact = self._local.interact = InteractClient(*self._args, **self._kwargs)
+
+        session = self.interact.session
+        session_id = session.id if session else None
+        if (interact.session.id if interact.session else None) != session_id:
+            if session_id is None:
+                del interact.session
+            else:
+                interact.session = session_id
+        return interact
+
+    def _call(self, name, *args, **kwargs):
+        return getattr(self._thread_interact(), name)(*args, **kwargs)
+
+    def _call_shared(self, name, *args, **kwargs):
+        with self._lock:
+            return getattr(self.interact, name)(*args, **kwargs)
+
+    call = _run_in_executor('call')
+    connect = _run_in_executor('connect', shared=True)
+    disconnect = _run_in_executor('disconnect', shared=True)
+
+    # Session Management Methods
+    login = _run_in_executor('login', shared=True)
+    logout = _run_in_executor('logout', shared=True)
+    login_with_certificate = _run_in_executor('login_with_certificate', shared=True)
+    authenticate_server = _run_in_executor('authenticate_server', shared=True)
+
+    # List Management Methods
+    merge_list_members = _run_in_executor('merge_list_members')
+    merge_list_members_RIID = _run_in_executor('merge_list_members_RIID')
+    delete_list_members = _run_in_executor('delete_list_members')
+    retrieve_list_members = _run_in_executor('retrieve_list_members')
+    retrieve_list_members_iter = _run_in_executor('retrieve_list_members_iter')
+
+    # Table Management Methods
+    create_table = _run_in_executor('create_table')
+    create_table_with_pk = _run_in_executor('create_table_with_pk')
+    delete_table = _run_in_executor('delete_table')
+    delete_profile_extension_members = _run_in_executor('delete_profile_extension_members')
+    retrieve_profile_extension_records = _run_in_executor('retrieve_profile_extension_records')
+    truncate_table = _run_in_executor('truncate_table')
+    delete_table_records = _run_in_executor('delete_table_records')
+    merge_table_records = _run_in_executor('merge_table_records')
+    merge_table_records_with_pk = _run_in_executor('merge_table_records_with_pk')
+    merge_into_profile_extension = _run_in_executor('merge_into_profile_extension')
+    retrieve_table_records = _run_in_executor('retrieve_table_records')
+
+    # Campaign Management Methods
+    trigger_custom_event = _run_in_executor('trigger_custom_event')
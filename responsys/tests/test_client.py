@@ -1,13 +1,192 @@
-from time import time
+import asyncio
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import re
+import threading
+from tempfile import TemporaryDirectory
 import unittest
 from unittest.mock import patch, Mock
 from urllib.error import URLError
 
+from requests import ConnectionError, Session
 from suds import WebFault
+from suds.client import Client
+from suds.transport import Reply
+from suds.sudsobject import Object
 
 from ..exceptions import (
     ConnectError, ServiceError, ApiLimitError, AccountFault, TableFault, ListFault)
 from .. import client
+from ..transport import PooledTransport
+from ..types import InteractObject
+from .test_types import RETRIEVE_REPLY, RETRIEVE_TABLE_REPLY
+
+FROZEN_TIME = 1700000000.0
+
+
+class InteractClientPropertyTests(unittest.TestCase):
+    """ Test InteractClient properties, on an instance shared by tests that do not modify it """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.client = Mock()
+        cls.configuration = {
+            'username': 'username',
+            'password': 'password',
+            'pod': '5',
+            'client': cls.client,
+        }
+        cls.interact = client.InteractClient(**cls.configuration)
+
+    def test_starts_disconnected(self):
+        self.assertFalse(self.interact.connected)
+
+    def test_client_property_returns_configured_client(self):
+        self.assertEqual(self.interact.client, self.client)
+
+    @patch.object(client, 'Client')
+    def test_client_property_builds_client_for_pod_once(self, Client):
+        interact = client.InteractClient(**dict(self.configuration, client=None))
+        self.assertEqual(interact.client, Client.return_value)
+        interact.client
+        Client.assert_called_once()
+        self.assertEqual(Client.call_args[0], (interact.wsdl,))
+        self.assertEqual(Client.call_args[1]['location'], interact.endpoint)
+        self.assertEqual(Client.call_args[1]['timeout'], interact.timeout)
+
+    @patch.object(client, 'ObjectCache')
+    @patch.object(client, 'Client')
+    def test_client_property_caches_parsed_wsdl_in_cache_dir(self, Client, ObjectCache):
+        configuration = dict(self.configuration, client=None, cache_dir='/tmp/wsdl')
+        client.InteractClient(**configuration).client
+        ObjectCache.assert_called_once_with(
+            location='/tmp/wsdl', days=client.InteractClient.WSDL_CACHE_DAYS)
+        self.assertEqual(Client.call_args[1]['cache'], ObjectCache.return_value)
+        self.assertEqual(Client.call_args[1]['cachingpolicy'], 1)
+
+    @patch.object(client, 'Client')
+    def test_client_property_sends_requests_over_shared_connection_pool(self, Client):
+        configuration = dict(self.configuration, client=None)
+        client.InteractClient(**configuration).client
+        client.InteractClient(**configuration).client
+        first, second = [call[1]['transport'] for call in Client.call_args_list]
+        self.assertIsInstance(first, PooledTransport)
+        for prefix in ('http://', 'https://'):
+            with self.subTest(prefix=prefix):
+                adapter = first.session.adapters[prefix]
+                self.assertIs(adapter, second.session.adapters[prefix])
+                self.assertEqual(adapter._pool_maxsize, PooledTransport.POOL_MAXSIZE)
+
+    @patch.object(client, 'Client')
+    def test_client_property_keeps_cookies_per_instance(self, Client):
+        configuration = dict(self.configuration, client=None)
+        client.InteractClient(**configuration).client
+        client.InteractClient(**configuration).client
+        first, second = [call[1]['transport'] for call in Client.call_args_list]
+        self.assertIsNot(first.session, second.session)
+        self.assertIsNot(first.session.cookies, second.session.cookies)
+
+    @patch.object(client.InteractClient, 'WSDLS', {'pod': 'pod_wsdl'})
+    @patch.object(client.InteractClient, 'ENDPOINTS', {'pod': 'pod_endpoint'})
+    def test_wsdl_property_returns_correct_value(self):
+        interact = client.InteractClient(**dict(self.configuration, pod='pod'))
+        self.assertEqual(interact.wsdl, 'pod_wsdl')
+
+    @patch.object(client.InteractClient, 'WSDLS', {'pod': 'pod_wsdl'})
+    @patch.object(client.InteractClient, 'ENDPOINTS', {'pod': 'pod_endpoint'})
+    def test_endpoint_property_returns_correct_value(self):
+        interact = client.InteractClient(**dict(self.configuration, pod='pod'))
+        self.assertEqual(interact.endpoint, 'pod_endpoint')
+
+    def test_pod_tables_are_read_only(self):
+        with self.assertRaises(TypeError):
+            client.InteractClient.WSDLS['pod'] = 'pod_wsdl'
+        with self.assertRaises(TypeError):
+            client.InteractClient.ENDPOINTS['pod'] = 'pod_endpoint'
+
+    def test_faults_table_is_read_only(self):
+        with self.assertRaises(TypeError):
+            client.InteractClient.FAULTS['SomeFault'] = ServiceError
+
+    def test_init_raises_KeyError_for_unknown_pod(self):
+        with self.assertRaises(KeyError):
+            client.InteractClient(**dict(self.configuration, pod='pod'))
+
+
+WSDL = (Path(__file__).parent / 'interact.wsdl').as_uri()
+LOGIN_REPLY = b"""<?xml version="1.0" encoding="UTF-8"?>
+<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
+  <soapenv:Body>
+    <loginResponse xmlns="urn:ws.rsys.com">
+      <result><sessionId>session_id</sessionId></result>
+    </loginResponse>
+  </soapenv:Body>
+</soapenv:Envelope>"""
+
+
+@patch.object(client.InteractClient, 'WSDLS', {'pod': WSDL})
+@patch.object(client.InteractClient, 'ENDPOINTS', {'pod': 'https://interact.test/ws'})
+class InteractClientSudsTests(unittest.TestCase):
+    """ Test InteractClient with real suds clients built from a local WSDL file """
+
+    def setUp(self):
+        self.cache_dir = TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+        self.configuration = {
+            'username': 'username',
+            'password': 'password',
+            'pod': 'pod',
+            'cache_dir': self.cache_dir.name,
+        }
+        request = patch.object(Session, 'request').start()
+        self.addCleanup(patch.stopall)
+        request.return_value = Mock(status_code=200, content=LOGIN_REPLY, headers={})
+        self.request = request
+
+    def test_client_property_builds_suds_client_from_wsdl(self):
+        interact = client.InteractClient(**self.configuration)
+        self.assertIsInstance(interact.client, Client)
+        self.assertEqual(interact.client.factory.create('SessionHeader').sessionId, None)
+
+    def test_clients_do_not_share_options(self):
+        first = client.InteractClient(**self.configuration)
+        second = client.InteractClient(**dict(self.configuration, timeout=30))
+        first.session = 'session_id'
+        self.assertEqual(first.client.options.soapheaders.sessionId, 'session_id')
+        self.assertEqual(second.client.options.soapheaders, ())
+        self.assertEqual(first.client.options.timeout, 5)
+        self.assertEqual(second.client.options.timeout, 30)
+
+    def test_connect_logs_in_over_pooled_transport(self):
+        interact = client.InteractClient(**self.configuration)
+        interact.connect()
+        self.assertEqual(interact.session.id, 'session_id')
+        method, url = self.request.call_args[0]
+        self.assertEqual((method, url), ('POST', 'https://interact.test/ws'))
+        self.assertIn(b':username>username</', self.request.call_args[1]['data'])
+
+    def test_xml_client_does_not_share_options(self):
+        interact = client.InteractClient(**self.configuration)
+        interact.session = 'session_id'
+        xml_client = interact.xml_client
+        self.assertTrue(xml_client.options.retxml)
+        self.assertFalse(interact.client.options.retxml)
+        self.assertEqual(xml_client.options.soapheaders.sessionId, 'session_id')
+        self.assertIs(xml_client.options.transport.session, interact._http_session)
+        self.assertIs(interact.client.options.transport.session, interact._http_session)
+
+    def test_retrieve_list_members_with_user_provided_client(self):
+        suds_client = Client(WSDL, location='https://interact.test/ws', cache=None)
+        interact = client.InteractClient(**dict(self.configuration, client=suds_client))
+        interact.session = 'session_id'
+        self.request.return_value.content = RETRIEVE_REPLY
+        record_data = interact.retrieve_list_members(
+            InteractObject('folder', 'list'), 'RIID', ['EMAIL_ADDRESS_', 'CITY_'], [1, 2])
+        self.assertEqual(record_data.records, [('a@example.com', 'Paris'), ('b@example.com', None)])
+        self.assertIsNone(interact.xml_client.messages['rx'])
+        message = self.request.call_args[1]['data']
+        self.assertIn(b':sessionId>session_id</', message)
 
 
 class InteractClientTests(unittest.TestCase):
@@ -18,56 +197,50 @@ class InteractClientTests(unittest.TestCase):
         self.configuration = {
             'username': 'username',
             'password': 'password',
-            'pod': 'pod',
+            'pod': '5',
             'client': self.client,
         }
         self.interact = client.InteractClient(**self.configuration)
 
-    def test_starts_disconnected(self):
-        self.assertFalse(self.interact.connected)
-
-    @patch.object(client, 'time')
-    def test_connected_property_returns_time_of_connection_after_successful_connect(self, mtime):
-        mtime.return_value = connection_time = time()
+    @patch.object(client, 'time', lambda: FROZEN_TIME)
+    def test_connected_property_returns_time_of_connection_after_successful_connect(self):
         self.interact.connect()
-        self.assertEqual(self.interact.connected, connection_time)
+        self.assertEqual(self.interact.connected, FROZEN_TIME)
 
-    @patch.object(client, 'time')
+    @patch.object(client, 'time', lambda: FROZEN_TIME)
     @patch.object(client.InteractClient, 'login')
-    def test_session_property_returns_session_id_and_start_after_successful_connect(
-            self, login, mtime):
-
-        mtime.return_value = session_start = time()
+    def test_session_property_returns_session_id_and_start_after_successful_connect(self, login):
         session_id = "session_id"
         login.return_value = Mock(session_id=session_id)
         self.interact.connect()
 
-        self.assertEqual(self.interact.session, (session_id, session_start))
+        self.assertEqual(self.interact.session, (session_id, FROZEN_TIME))
 
-    @patch.object(client.InteractClient, 'login')
-    def test_connect_reuses_session_if_possible_and_does_not_login(
-            self, login):
-        self.interact.session = "session_id"
+    def test_session_property_provides_id_and_start(self):
+        self.interact.session = 'session_id'
+        self.assertEqual(self.interact.session.id, 'session_id')
+        self.assertIsInstance(self.interact.session.start, float)
 
-        self.interact.connect()
-        self.assertFalse(login.called)
+    def test_session_is_expired_property_uses_current_session_lifetime(self):
+        self.interact.session = 'session_id'
+        self.assertFalse(self.interact.session.is_expired)
+        self.interact.session_lifetime = -1
+        self.assertTrue(self.interact.session.is_expired)
 
+    @patch.object(client, 'time')
     @patch.object(client.InteractClient, 'login')
-    def test_connect_gets_new_session_if_session_is_expired(self, login):
+    def test_connect_returns_existing_connection_if_already_connected(self, login, mtime):
+        mtime.return_value = FROZEN_TIME
         self.interact.connect()
-        self.interact.disconnect()
-        self.interact.session_lifetime = -1
+        mtime.return_value = FROZEN_TIME + 1
 
-        self.interact.connect()
-        self.assertEqual(login.call_count, 2)
+        self.assertEqual(self.interact.connect(), FROZEN_TIME)
+        self.assertEqual(login.call_count, 1)
 
     def test_connected_property_returns_false_after_disconnect(self):
         self.interact.disconnect()
         self.assertFalse(self.interact.connected)
 
-    def test_client_property_returns_configured_client(self):
-        self.assertEqual(self.interact.client, self.client)
-
     def test_call_method_calls_soap_method_with_passed_arguments(self):
         self.interact.call('somemethod', 'arg')
         self.client.service.somemethod.assert_called_with('arg')
@@ -76,11 +249,73 @@ class InteractClientTests(unittest.TestCase):
         self.client.service.bananas.return_value = 1
         self.assertEqual(self.interact.call('bananas'), 1)
 
+    def test_call_method_reuses_soap_method_for_later_calls(self):
+        self.interact.call('bananas')
+        bananas = self.client.service.bananas
+        self.client.service = Mock()
+        self.interact.call('bananas')
+        self.assertEqual(bananas.call_count, 2)
+
+    @patch.object(client, 'Client')
+    def test_call_method_returns_reply_xml_from_xml_client_for_retxml(self, Client):
+        Client.return_value.service.bananas.return_value = b'<xml/>'
+        self.assertEqual(self.interact.call('bananas', retxml=True), b'<xml/>')
+        self.assertEqual(Client.call_args[0], (self.interact.wsdl,))
+        self.assertTrue(Client.call_args[1]['retxml'])
+
+    @patch.object(client, 'Client')
+    def test_retrieve_list_members_parses_reply_xml(self, Client):
+        Client.return_value.service.retrieveListMembers.return_value = RETRIEVE_REPLY
+        record_data = self.interact.retrieve_list_members(Mock(), 'RIID', ['EMAIL_ADDRESS_'], [1])
+        self.assertEqual(len(record_data), 2)
+
+    @patch.object(client, 'Client')
+    def test_retrieve_list_members_iter_yields_records_from_reply_xml(self, Client):
+        Client.return_value.service.retrieveListMembers.return_value = RETRIEVE_REPLY
+        records = self.interact.retrieve_list_members_iter(Mock(), 'RIID', ['CITY_'], [1])
+        self.assertEqual([record['CITY_'] for record in records], ['Paris', None])
+
+    @patch.object(client, 'Client')
+    def test_retrieve_records_parses_reply_xml_without_record_data_element(self, Client):
+        service = Client.return_value.service
+        cases = (
+            ('retrieveTableRecords', self.interact.retrieve_table_records,
+                (Mock(), 'RIID', ['EMAIL_ADDRESS_', 'CITY_'], [1, 2])),
+            ('retrieveProfileExtensionRecords', self.interact.retrieve_profile_extension_records,
+                (Mock(), ['EMAIL_ADDRESS_', 'CITY_'], [1, 2])),
+        )
+        for soap_method, method, args in cases:
+            with self.subTest(soap_method):
+                getattr(service, soap_method).return_value = RETRIEVE_TABLE_REPLY
+                record_data = method(*args)
+                self.assertEqual(record_data.field_names, ['EMAIL_ADDRESS_', 'CITY_'])
+                self.assertEqual(
+                    record_data.records, [('a@example.com', 'Paris'), ('b@example.com', None)])
+
+    @patch.object(client, 'Client')
+    def test_session_header_is_set_on_xml_client(self, Client):
+        self.interact.xml_client
+        self.interact.session = 'session_id'
+        self.interact.xml_client.set_options.assert_called_with(
+            soapheaders=self.client.factory.create.return_value)
+
+    @patch.object(client, 'Client')
+    def test_xml_client_is_built_with_current_session_header(self, Client):
+        self.interact.session = 'session_id'
+        self.interact.xml_client
+        self.assertEqual(
+            Client.call_args[1]['soapheaders'], self.client.factory.create.return_value)
+
     def test_call_method_raises_ConnectError_for_url_timeout(self):
         self.client.service.rm_rf.side_effect = URLError('Timeout')
         with self.assertRaises(ConnectError):
             self.interact.call('rm_rf', '/.')
 
+    def test_call_method_raises_ConnectError_for_transport_connection_error(self):
+        self.client.service.rm_rf.side_effect = ConnectionError('Connection refused')
+        with self.assertRaises(ConnectError):
+            self.interact.call('rm_rf', '/.')
+
     def test_call_method_raises_ServiceError_for_unhandled_webfault(self):
         self.client.service.rm_rf.side_effect = WebFault(Mock(), Mock())
         with self.assertRaises(ServiceError):
@@ -104,13 +339,11 @@ class InteractClientTests(unittest.TestCase):
         with self.assertRaises(TableFault):
             self.interact.call('give_me_a_table', 'awesome_table')
 
-    @patch.object(client.InteractClient, 'WSDLS', {'pod': 'pod_wsdl'})
-    def test_wsdl_property_returns_correct_value(self):
-        self.assertEqual(self.interact.wsdl, 'pod_wsdl')
-
-    @patch.object(client.InteractClient, 'ENDPOINTS', {'pod': 'pod_endpoint'})
-    def test_endpoint_property_returns_correct_value(self):
-        self.assertEqual(self.interact.endpoint, 'pod_endpoint')
+    def test_call_method_raises_AccountFault_for_account_fault_exception_from_service(self):
+        self.client.service.login.side_effect = WebFault(
+            Mock(faultstring='AccountFault'), Mock())
+        with self.assertRaises(AccountFault):
+            self.interact.call('login', 'username', 'password')
 
     @patch.object(client.InteractClient, 'connect', Mock())
     def test_entering_context_calls_connect(self):
@@ -140,6 +373,12 @@ class InteractClientTests(unittest.TestCase):
         self.interact.connect()
         self.interact.client.set_options.assert_called_once_with(soapheaders=soapheaders)
 
+    def test_session_header_is_created_once_and_updated_with_session_id(self):
+        self.interact.session = 'first'
+        self.interact.session = 'second'
+        self.client.factory.create.assert_called_once_with('SessionHeader')
+        self.assertEqual(self.client.factory.create.return_value.sessionId, 'second')
+
     @patch.object(client.InteractClient, 'login')
     @patch.object(client.InteractClient, 'logout')
     def test_connect_abandons_session_if_session_is_expired(self, logout, login):
@@ -150,21 +389,67 @@ class InteractClientTests(unittest.TestCase):
         logout.assert_called_once_with()
         self.assertNotEqual(self.interact.session[0], session_id)
 
-    @patch.object(client.InteractClient, 'logout')
-    def test_disconnect_does_not_logout_if_session_is_available(self, logout):
-        self.session = 'session_id'
-
-        self.interact.disconnect()
-        self.assertEqual(logout.call_count, 0)
-
-    @patch.object(client.InteractClient, 'logout')
-    def test_disconnect_calls_logout_if_session_is_expired(self, logout):
-        self.interact.session = 'session_id'
-        self.interact.session_lifetime = -1
-
-        self.interact.disconnect()
-        self.assertEqual(logout.call_count, 1)
-        self.assertIsNone(self.interact.session)
+    def test_session_lifecycle_across_disconnect_and_reconnect(self):
+        # (session_lifetime, abandon_session, session kept on disconnect, logins, logouts)
+        cases = (
+            (600, False, True, 1, 0),
+            (-1, False, False, 2, 1),
+            (600, True, False, 2, 1),
+        )
+        for session_lifetime, abandon_session, kept, logins, logouts in cases:
+            with self.subTest(session_lifetime=session_lifetime, abandon_session=abandon_session):
+                interact = client.InteractClient(
+                    **dict(self.configuration, session_lifetime=session_lifetime))
+                with patch.object(interact, 'login') as login, \
+                        patch.object(interact, 'logout') as logout:
+                    interact.connect()
+                    interact.disconnect(abandon_session=abandon_session)
+                    if kept:
+                        self.assertIsNotNone(interact.session)
+                    else:
+                        self.assertIsNone(interact.session)
+                    interact.connect()
+                self.assertEqual(login.call_count, logins)
+                self.assertEqual(logout.call_count, logouts)
+
+    def test_delete_list_members_returns_delete_result_for_each_result(self):
+        self.client.service.deleteListMembers.return_value = [Mock(id=1), Mock(id=2)]
+        results = self.interact.delete_list_members(Mock(), 'RIID', [1, 2])
+        self.assertEqual([result.id for result in results], [1, 2])
+
+    def test_delete_list_members_returns_list_for_single_result(self):
+        self.client.service.deleteListMembers.return_value = Mock(id=1)
+        results = self.interact.delete_list_members(Mock(), 'RIID', [1])
+        self.assertEqual([result.id for result in results], [1])
+
+    def test_delete_list_members_returns_list_for_single_suds_object_result(self):
+        result = Object()
+        result.id, result.success, result.errorMessage, result.exceptionCode = 1, True, None, None
+        self.client.service.deleteListMembers.return_value = result
+        results = self.interact.delete_list_members(Mock(), 'RIID', [1])
+        self.assertEqual([result.id for result in results], [1])
+
+    def test_trigger_custom_event_sends_recipients_in_batches_of_batch_size(self):
+        self.client.service.triggerCustomEvent.side_effect = lambda event, batch: batch
+        recipient_data = [Mock(), Mock(), Mock()]
+
+        results = self.interact.trigger_custom_event(Mock(), recipient_data, batch_size=2)
+        self.assertEqual(self.client.service.triggerCustomEvent.call_count, 2)
+        self.assertEqual(len(results), 3)
+
+    def test_trigger_custom_event_sends_recipients_in_single_call(self):
+        self.client.service.triggerCustomEvent.side_effect = lambda event, batch: batch
+        cases = (
+            ('no batch size', [Mock(), Mock(), Mock()], None),
+            ('recipients within batch size', [Mock(), Mock()], 2),
+            ('no recipients', [], 2),
+        )
+        for name, recipient_data, batch_size in cases:
+            with self.subTest(name):
+                self.client.service.triggerCustomEvent.reset_mock()
+                results = self.interact.trigger_custom_event(Mock(), recipient_data, batch_size)
+                self.assertEqual(self.client.service.triggerCustomEvent.call_count, 1)
+                self.assertEqual(len(results), len(recipient_data))
 
     @patch.object(client.InteractClient, 'logout')
     def test_disconnect_calls_logout_if_abandon_session_is_passed(self, logout):
@@ -173,3 +458,93 @@ class InteractClientTests(unittest.TestCase):
         self.assertEqual(logout.call_count, 1)
         self.assertIsNone(self.interact.session)
 
+
+class AsyncInteractClientTests(unittest.TestCase):
+    """ Test AsyncInteractClient """
+
+    def setUp(self):
+        self.client = Mock()
+        self.interact = client.AsyncInteractClient(
+            'username', 'password', '5', client=self.client)
+        # suds clients built for executor threads
+        self.Client = patch.object(client, 'Client').start()
+        self.addCleanup(patch.stopall)
+
+    def test_passes_configuration_to_interact_client(self):
+        self.assertEqual(self.interact.interact.client, self.client)
+
+    def test_call_method_calls_soap_method_with_passed_arguments(self):
+        asyncio.run(self.interact.call('somemethod', 'arg'))
+        self.Client.return_value.service.somemethod.assert_called_with('arg')
+
+    def test_call_method_returns_soap_method_return_value(self):
+        self.Client.return_value.service.bananas.return_value = 1
+        self.assertEqual(asyncio.run(self.interact.call('bananas')), 1)
+
+    def test_call_method_does_not_use_shared_client(self):
+        asyncio.run(self.interact.call('bananas'))
+        self.assertFalse(self.client.service.bananas.called)
+
+    def test_calls_use_session_of_shared_client(self):
+        self.interact.interact.session = 'session_id'
+        asyncio.run(self.interact.call('bananas'))
+        self.Client.return_value.set_options.assert_called_with(
+            soapheaders=self.Client.return_value.factory.create.return_value)
+
+    @patch.object(client.InteractClient, 'login')
+    def test_connect_logs_in_on_shared_client(self, login):
+        login.return_value = Mock(session_id='session_id')
+        asyncio.run(self.interact.connect())
+        self.assertEqual(self.interact.interact.session.id, 'session_id')
+        self.assertFalse(self.Client.called)
+
+    @patch.object(client.InteractClient, 'disconnect')
+    @patch.object(client.InteractClient, 'connect')
+    def test_async_context_connects_and_disconnects(self, connect, disconnect):
+        async def use_context():
+            async with self.interact:
+                self.assertTrue(connect.called)
+                self.assertFalse(disconnect.called)
+
+        asyncio.run(use_context())
+        self.assertTrue(disconnect.called)
+
+
+@patch.object(client.InteractClient, 'WSDLS', {'pod': WSDL})
+@patch.object(client.InteractClient, 'ENDPOINTS', {'pod': 'https://interact.test/ws'})
+class AsyncInteractClientConcurrencyTests(unittest.TestCase):
+    """ Test AsyncInteractClient calls running concurrently on real suds clients """
+
+    def setUp(self):
+        self.cache_dir = TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+        self.executor = ThreadPoolExecutor(max_workers=4)
+        self.addCleanup(self.executor.shutdown)
+
+    def test_each_reply_goes_back_to_its_caller(self):
+        interact = client.AsyncInteractClient(
+            'username', 'password', 'pod', cache_dir=self.cache_dir.name, executor=self.executor)
+        # Holds calls until one is in flight on each thread
+        in_flight = threading.Barrier(4, timeout=5)
+        threads_by_transport = defaultdict(set)
+
+        # Replies with the username of the login request as the session id
+        def send(transport, request):
+            threads_by_transport[transport].add(threading.get_ident())
+            in_flight.wait()
+            username = re.search(rb':username>(.*?)<', request.message).group(1)
+            return Reply(200, {}, LOGIN_REPLY.replace(b'session_id', username))
+
+        usernames = ['user{}'.format(i) for i in range(40)]
+
+        async def login_all():
+            return await asyncio.gather(*[
+                interact.call('login', username, 'password') for username in usernames])
+
+        with patch.object(PooledTransport, 'send', autospec=True, side_effect=send):
+            results = asyncio.run(login_all())
+        self.assertEqual([result.sessionId for result in results], usernames)
+        # suds clients are not thread-safe, none may be used by more than one thread
+        self.assertEqual(len(threads_by_transport), 4)
+        for threads in threads_by_transport.values():
+            self.assertEqual(len(threads), 1)
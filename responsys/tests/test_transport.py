@@ -0,0 +1,71 @@
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+import unittest
+from unittest.mock import Mock
+
+from suds.transport import Request, TransportError
+
+from ..transport import PooledTransport
+
+
+class PooledTransportTests(unittest.TestCase):
+    """ Test PooledTransport """
+
+    def setUp(self):
+        self.session = Mock()
+        self.session.request.return_value = Mock(status_code=200, content=b'<xml/>', headers={})
+        self.transport = PooledTransport(self.session)
+        self.request = Request('https://ws5.responsys.net', b'<soap/>')
+
+    def test_default_session_pools_connections_for_http_and_https(self):
+        transport = PooledTransport()
+        for prefix in ('http://', 'https://'):
+            adapter = transport.session.adapters[prefix]
+            self.assertEqual(adapter._pool_maxsize, PooledTransport.POOL_MAXSIZE)
+
+    def test_sessions_created_with_an_adapter_share_it(self):
+        adapter = PooledTransport.create_adapter()
+        first = PooledTransport.create_session(adapter)
+        second = PooledTransport.create_session(adapter)
+        self.assertIs(first.adapters['https://'], adapter)
+        self.assertIs(second.adapters['https://'], adapter)
+        self.assertIsNot(first.cookies, second.cookies)
+
+    def test_send_posts_message_through_session(self):
+        self.transport.send(self.request)
+        self.session.request.assert_called_once_with(
+            'POST', self.request.url, data=b'<soap/>', headers=self.request.headers,
+            timeout=self.transport.options.timeout)
+
+    def test_send_returns_reply_with_response_content(self):
+        self.assertEqual(self.transport.send(self.request).message, b'<xml/>')
+
+    def test_open_returns_file_like_response_content(self):
+        self.assertEqual(self.transport.open(self.request).read(), b'<xml/>')
+
+    def test_send_raises_TransportError_with_reply_for_error_status(self):
+        self.session.request.return_value = Mock(
+            status_code=500, reason='Internal Server Error', content=b'<fault/>')
+        with self.assertRaises(TransportError) as context:
+            self.transport.send(self.request)
+        self.assertEqual(context.exception.httpcode, 500)
+        self.assertEqual(context.exception.fp.read(), b'<fault/>')
+
+    def test_request_timeout_overrides_transport_timeout(self):
+        self.request.timeout = 1
+        self.transport.send(self.request)
+        self.assertEqual(self.session.request.call_args[1]['timeout'], 1)
+
+    def test_transports_share_session_but_not_options(self):
+        other = PooledTransport(self.session)
+        other.options.timeout = 1
+        self.assertIs(other.session, self.session)
+        self.assertNotEqual(self.transport.options.timeout, 1)
+
+    def test_open_reads_local_file_urls_without_session(self):
+        with NamedTemporaryFile(suffix='.wsdl') as wsdl:
+            wsdl.write(b'<definitions/>')
+            wsdl.flush()
+            reply = self.transport.open(Request(Path(wsdl.name).as_uri()))
+            self.assertEqual(reply.read(), b'<definitions/>')
+        self.assertFalse(self.session.request.called)
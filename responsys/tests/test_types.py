@@ -1,10 +1,61 @@
+from copy import deepcopy
+import sys
+from types import SimpleNamespace
 import unittest
+from xml.etree import ElementTree
 
 from mock import Mock, patch
+from suds.sudsobject import Object
 
 from ..types import (
-    InteractType, InteractObject, ListMergeRule, RecordData, Record, DeleteResult, LoginResult,
-    MergeResult, RecipientResult, ServerAuthResult, RecipientData, Recipient, OptionalData)
+    create_soap_object, to_soap_attribute, InteractType, InteractObject, ListMergeRule, RecordData,
+    Record, DeleteResult, LoginResult, MergeResult, RecipientResult, ServerAuthResult,
+    RecipientData, Recipient, OptionalData, CustomEvent)
+
+RETRIEVE_REPLY = b"""<?xml version="1.0" encoding="UTF-8"?>
+<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/"
+    xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">
+  <soapenv:Body>
+    <retrieveListMembersResponse xmlns="urn:ws.rsys.com">
+      <result>
+        <recordData>
+          <fieldNames>EMAIL_ADDRESS_</fieldNames>
+          <fieldNames>CITY_</fieldNames>
+          <records>
+            <fieldValues>a@example.com</fieldValues>
+            <fieldValues>Paris</fieldValues>
+          </records>
+          <records>
+            <fieldValues>b@example.com</fieldValues>
+            <fieldValues xsi:nil="true"/>
+          </records>
+        </recordData>
+      </result>
+    </retrieveListMembersResponse>
+  </soapenv:Body>
+</soapenv:Envelope>"""
+
+# Replies of retrieveTableRecords and retrieveProfileExtensionRecords have no recordData element
+RETRIEVE_TABLE_REPLY = RETRIEVE_REPLY.replace(
+    b'<recordData>', b'').replace(b'</recordData>', b'').replace(
+    b'retrieveListMembersResponse', b'retrieveTableRecordsResponse')
+
+
+class Fish(InteractType):
+    __slots__ = ('foo', 'red_fish', '_private')
+
+
+class Goldfish(Fish):
+    __slots__ = ('gold',)
+
+
+class FactoryClientTestCase(unittest.TestCase):
+
+    """ Base for tests needing a client whose factory creates a new suds object per call """
+
+    def setUp(self):
+        self.client = Mock()
+        self.client.factory.create.side_effect = lambda name: Object()
 
 
 class InteractTypeTests(unittest.TestCase):
@@ -12,140 +63,394 @@ class InteractTypeTests(unittest.TestCase):
     """ InteractType instance """
 
     def setUp(self):
-        self.type = InteractType(foo='bar')
+        self.type = Fish(foo='bar', red_fish=False)
         self.client = Mock()
 
     def test_soap_attribute_method_sets_attribute(self):
         """soap_attribute method sets attribute """
-        self.type.soap_attribute('red', True)
-        self.assertTrue(self.type.red)
+        self.type.soap_attribute('red_fish', True)
+        self.assertTrue(self.type.red_fish)
+
+    def test_soap_attribute_method_rejects_undeclared_attribute(self):
+        """soap_attribute method rejects undeclared attribute """
+        with self.assertRaises(AttributeError):
+            self.type.soap_attribute('blue', True)
+
+    def test_subclass_keeps_soap_name_set_in_class_body(self):
+        class Carp(Fish):
+            __slots__ = ()
+            soap_name = 'Koi'
+
+        self.assertEqual(Carp.soap_name, 'Koi')
+        self.assertEqual(Goldfish.soap_name, 'Goldfish')
 
-    def test_soap_attribute_method_registers_attribute(self):
-        """soap_attribute method registers attribute """
-        self.type.soap_attribute('blue', True)
-        self.assertIn('blue', self.type._attributes)
+    def test_subclass_without_slots_raises_TypeError(self):
+        with self.assertRaises(TypeError):
+            class Carp(Fish):
+                pass
 
-    def test_soap_name_property_returns_class_name(self):
-        """soap_name property returns class name """
-        self.assertEqual(self.type.soap_name, self.type.__class__.__name__)
+    def test_instance_has_no_attribute_dictionary(self):
+        self.assertFalse(hasattr(self.type, '__dict__'))
+
+    def test_soap_name_attribute_is_class_name(self):
+        """soap_name attribute is class name """
+        self.assertEqual(self.type.soap_name, 'Fish')
+        self.assertEqual(Goldfish.soap_name, 'Goldfish')
 
     def test_instance_provides_attributes_through_dictionary_lookup(self):
         self.assertEqual(self.type.foo, self.type['foo'])
 
     def test_get_soap_object_method_returns_client_factory_type(self):
         """get_soap_object_method returns client factory type """
-        soap_object = self.client.factory.create.return_value = Mock()
-        self.assertEqual(self.type.get_soap_object(self.client), soap_object)
+        self.client.factory.create.return_value = Object()
+        self.assertIsInstance(self.type.get_soap_object(self.client), Object)
+        self.client.factory.create.assert_called_once_with(self.type.soap_name)
+
+    def test_get_soap_object_method_creates_factory_type_once(self):
+        """get_soap_object method creates factory type once """
+        self.type.get_soap_object(self.client)
+        self.type.get_soap_object(self.client)
+        self.assertEqual(self.client.factory.create.call_count, 1)
 
     def test_get_soap_object_method_returns_object_with_correct_attributes_set(self):
         """get_soap_object method returns object with correct attributes set """
+        self.client.factory.create.return_value = Object()
         self.type.soap_attribute('red_fish', True)
         soap_object = self.type.get_soap_object(self.client)
-        self.assertTrue(all(
-            [hasattr(soap_object, attr) for attr in ['redFish', 'foo']]))
+        self.assertLessEqual({'redFish', 'foo'}, set(dir(soap_object)))
 
 
-class TypeEqualityTests(unittest.TestCase):
-    def setUp(self):
-        self.customer_id = 1
-        self.folder_name = 'folder'
-        self.object_name = 'object'
-        self.interact_object = InteractObject(self.folder_name, self.object_name)
-        self.optional_data = OptionalData({'one': 1})
-        self.recipient = Recipient(self.interact_object, customer_id=self.customer_id)
-        self.recipient_data = RecipientData(self.recipient, self.optional_data)
-
-    def test_interact_object_equality(self):
-        self.assertEqual(self.interact_object, InteractObject(self.folder_name, self.object_name))
-        self.assertNotEqual(self.interact_object, InteractObject('three', 'four'))
-
-    def test_recipient_object_equality(self):
+class SoapPairsTests(unittest.TestCase):
+    def test_pairs_declared_slots_with_soap_names(self):
+        self.assertEqual(Fish._soap_pairs, (('foo', 'foo'), ('red_fish', 'redFish')))
+
+    def test_includes_slots_declared_by_base_classes(self):
         self.assertEqual(
-            self.recipient, Recipient(self.interact_object, customer_id=self.customer_id))
-        self.assertNotEqual(self.recipient, Recipient(self.interact_object, customer_id=2))
+            Goldfish._soap_pairs, (('foo', 'foo'), ('red_fish', 'redFish'), ('gold', 'gold')))
+
+
+class CreateSoapObjectTests(FactoryClientTestCase):
+    def test_builds_each_type_once_per_factory(self):
+        create_soap_object(self.client, 'Recipient')
+        create_soap_object(self.client, 'Recipient')
+        self.client.factory.create.assert_called_once_with('Recipient')
 
-    def test_recipient_data_object_equality(self):
-        self.assertEqual(self.recipient_data, RecipientData(self.recipient, self.optional_data))
-        self.assertNotEqual(self.recipient_data, RecipientData(self.recipient, OptionalData({})))
+    def test_returns_separate_copies_of_prototype(self):
+        recipient = create_soap_object(self.client, 'Recipient')
+        recipient.customerId = 1
+        other = create_soap_object(self.client, 'Recipient')
+        self.assertFalse(hasattr(other, 'customerId'))
+        self.assertNotIn('customerId', other)
+
+
+class ToSoapAttributeTests(unittest.TestCase):
+    def test_converts_snake_case_to_camel_case(self):
+        self.assertEqual(to_soap_attribute('reject_record_if_channel_empty'),
+                         'rejectRecordIfChannelEmpty')
+        self.assertEqual(to_soap_attribute('id'), 'id')
+
+    def test_returns_interned_names(self):
+        self.assertIs(to_soap_attribute('field_values'), sys.intern('fieldValues'))
+
+
+class TypeEqualityTests(unittest.TestCase):
+    interact_object = InteractObject('folder', 'object')
+    recipient = Recipient(interact_object, customer_id=1)
+    recipient_data = RecipientData(recipient, OptionalData({'one': 1}))
+
+    # (instance, equal instance, unequal instance)
+    cases = (
+        (interact_object, InteractObject('folder', 'object'), InteractObject('three', 'four')),
+        (recipient,
+            Recipient(interact_object, customer_id=1),
+            Recipient(interact_object, customer_id=2)),
+        (recipient_data,
+            RecipientData(recipient, OptionalData({'one': 1})),
+            RecipientData(recipient, OptionalData({}))),
+    )
+
+    def test_type_is_not_equal_to_other_objects(self):
+        self.assertNotEqual(self.interact_object, SimpleNamespace(
+            folder_name='folder', object_name='object'))
+
+    def test_type_is_not_equal_to_type_missing_its_attributes(self):
+        self.assertNotEqual(self.recipient_data, self.interact_object)
+
+    def test_type_equality(self):
+        for instance, equal, unequal in self.cases:
+            with self.subTest(type=instance.soap_name):
+                self.assertEqual(instance, equal)
+                self.assertNotEqual(instance, unequal)
 
 
 class InteractTypeChildTests(unittest.TestCase):
 
     """ InteractType descendant """
 
-    @classmethod
-    def generate_type_methods(cls, types_and_expectations):
-        """ Auto generates test methods for type attribute tests """
-        for TypeClass, init, attrs in types_and_expectations:
-            def create_test_func(TypeClass, init, attrs):
-                def test_method(self):
-                    instance = TypeClass(**init)
-                    for attr in attrs:
-                        self.assertEqual(getattr(instance, attr), attrs[attr])
-
-                test_method.__name__ = 'test_%s_has_expected_attributes' % TypeClass.__name__
-                return test_method
-
-            test_method = create_test_func(TypeClass, init, attrs)
-            setattr(cls, test_method.__name__, test_method)
-        return
-
-
-InteractTypeChildTests.generate_type_methods([
-    # (TypeToTest
-    #   initializer kwargs,
-    #   attributes expectations)
-    (InteractObject,
-        {'folder_name': 'blarg', 'object_name': 'fuuuuu'},
-        {'folder_name': 'blarg', 'object_name': 'fuuuuu'}),
-    (DeleteResult,
-        {'delete_result': Mock(errorMessage='', success=True, exceptionCode='', id=1)},
-        {'error_message': '', 'success': True, 'exception_code': '', 'id': 1}),
-    (LoginResult,
-        {'login_result': Mock(sessionId=1)},
-        {'session_id': 1}),
-    (ListMergeRule,
-        {'insert_on_no_match': 'A'},
-        {'insert_on_no_match': 'A'}),
-    (Record,
-        {'record': [1, 2, 3]},
-        {'field_values': [1, 2, 3]}),
-    (MergeResult,
-        {'merge_result': Mock(insertCount=1, updateCount=1, rejectedCount=1, totalCount=3,
-         errorMessage='Blarg')},
-        {'insert_count': 1, 'update_count': 1, 'rejected_count': 1, 'total_count': 3,
-         'error_message': 'Blarg'}),
-    (RecipientResult,
-        {'recipient_result': Mock(recipientId=1, errorMessage='Blarg')},
-        {'recipient_id': 1, 'error_message': 'Blarg'}),
-    (ServerAuthResult,
-        {'server_auth_result': Mock(authSessionId=1, encryptedClientChallenge='boo',
-         serverChallenge='ahhh')},
-        {'auth_session_id': 1, 'encrypted_client_challenge': 'boo', 'server_challenge': 'ahhh'})
-])
+    cases = (
+        # (TypeToTest
+        #   initializer kwargs,
+        #   attributes expectations)
+        (InteractObject,
+            {'folder_name': 'blarg', 'object_name': 'fuuuuu'},
+            {'folder_name': 'blarg', 'object_name': 'fuuuuu'}),
+        (DeleteResult,
+            {'delete_result': SimpleNamespace(
+                errorMessage='', success=True, exceptionCode='', id=1)},
+            {'error_message': '', 'success': True, 'exception_code': '', 'id': 1}),
+        (LoginResult,
+            {'login_result': SimpleNamespace(sessionId=1)},
+            {'session_id': 1}),
+        (ListMergeRule,
+            {'insert_on_no_match': 'A'},
+            {'insert_on_no_match': 'A'}),
+        (Record,
+            {'record': [1, 2, 3]},
+            {'field_values': [1, 2, 3]}),
+        (MergeResult,
+            {'merge_result': SimpleNamespace(
+                insertCount=1, updateCount=1, rejectedCount=1, totalCount=3, errorMessage='Blarg')},
+            {'insert_count': 1, 'update_count': 1, 'rejected_count': 1, 'total_count': 3,
+             'error_message': 'Blarg'}),
+        (RecipientResult,
+            {'recipient_result': SimpleNamespace(recipientId=1, errorMessage='Blarg')},
+            {'recipient_id': 1, 'error_message': 'Blarg'}),
+        (ServerAuthResult,
+            {'server_auth_result': SimpleNamespace(
+                authSessionId=1, encryptedClientChallenge='boo', serverChallenge='ahhh')},
+            {'auth_session_id': 1, 'encrypted_client_challenge': 'boo',
+             'server_challenge': 'ahhh'}),
+    )
+
+    def test_type_has_expected_attributes(self):
+        for TypeClass, init, attrs in self.cases:
+            with self.subTest(type=TypeClass.__name__):
+                instance = TypeClass(**init)
+                for attr in attrs:
+                    self.assertEqual(getattr(instance, attr), attrs[attr])
 
 
 class RecordDataTests(unittest.TestCase):
     def setUp(self):
-        self.record_patcher = patch('responsys.types.Record')
-        self.Record = self.record_patcher.start()
-        self.addCleanup(self.record_patcher.stop)
-
         self.record_data = RecordData([{'foo': 1, 'bar': 2}, {'bar': 4, 'foo': 3}])
 
     def test_sets_proper_field_name_values(self):
         self.assertEqual(set(self.record_data.field_names), set(['foo', 'bar']))
 
+    def test_iterates_records_as_dictionaries(self):
+        self.assertEqual(list(self.record_data), [{'foo': 1, 'bar': 2}, {'foo': 3, 'bar': 4}])
+
     def test_sets_proper_record_values(self):
-        self.assertTrue(
-            self.record_data.records == [[1, 2], [3, 4]] or
-            self.record_data.records == [[2, 1], [4, 3]])
+        records = {tuple(record) for record in self.record_data.records}
+        self.assertIn(records, [{(1, 2), (3, 4)}, {(2, 1), (4, 3)}])
+
+
+class RecordTests(unittest.TestCase):
+    def test_keeps_list_of_values_without_copying(self):
+        values = [1, 2]
+        self.assertIs(Record(values).field_values, values)
+
+    def test_converts_other_value_sequences_to_list(self):
+        self.assertEqual(Record((1, 2)).field_values, [1, 2])
+
+    def test_iterates_values_and_has_length(self):
+        record = Record([1, 2])
+        self.assertEqual(list(record), [1, 2])
+        self.assertEqual(len(record), 2)
+
+
+class RecordDataSoapObjectTests(FactoryClientTestCase):
+    def setUp(self):
+        super().setUp()
+        self.record_data = RecordData([(1, 2), (3, 4)], field_names=('foo', 'bar'))
+
+    def test_get_soap_object_sets_field_names(self):
+        soap_object = self.record_data.get_soap_object(self.client)
+        self.assertEqual(soap_object.fieldNames, ['foo', 'bar'])
+
+    def test_get_soap_object_builds_soap_record_per_row(self):
+        soap_object = self.record_data.get_soap_object(self.client)
+        self.assertEqual(
+            [record.fieldValues for record in soap_object.records], [(1, 2), (3, 4)])
+        self.assertIsNot(soap_object.records[0], soap_object.records[1])
+
+
+class RecordDataRowsTests(unittest.TestCase):
+    def setUp(self):
+        self.record_data = RecordData(
+            [('a@example.com', 'Paris')], field_names=['EMAIL_ADDRESS_', 'CITY_'])
+
+    def test_rows_provide_values_by_field_name(self):
+        row, = self.record_data.rows()
+        self.assertEqual(row['EMAIL_ADDRESS_'], 'a@example.com')
+        self.assertEqual(row['CITY_'], 'Paris')
+
+    def test_rows_provide_values_as_attributes(self):
+        row, = self.record_data.rows()
+        self.assertEqual(row.CITY_, 'Paris')
+
+    def test_rows_are_tuples_of_values(self):
+        row, = self.record_data.rows()
+        self.assertEqual(row, ('a@example.com', 'Paris'))
+        self.assertEqual(row[0], 'a@example.com')
+
+    def test_rows_support_field_names_that_are_not_identifiers(self):
+        record_data = RecordData([(1, 2)], field_names=['_ID', 'first name'])
+        row, = record_data.rows()
+        self.assertEqual((row['_ID'], row['first name']), (1, 2))
+
+
+class RecordDataSingleFieldTests(unittest.TestCase):
+    def test_sets_record_values_for_single_field(self):
+        record_data = RecordData([{'foo': 1}, {'foo': 2}])
+        self.assertEqual(record_data.field_names, ['foo'])
+        self.assertEqual(record_data.records, [(1,), (2,)])
+
+
+class RecordDataFieldNamesTests(unittest.TestCase):
+    def test_accepts_value_sequences_ordered_by_field_names(self):
+        record_data = RecordData([(1, 2), (3, 4)], field_names=('foo', 'bar'))
+        self.assertEqual(record_data.field_names, ['foo', 'bar'])
+        self.assertEqual(record_data.records, [(1, 2), (3, 4)])
+
+    def test_from_dataframe_reads_rows_in_column_order(self):
+        dataframe = Mock(columns=['foo', 'bar'])
+        dataframe.itertuples.return_value = iter([(1, 2), (3, 4)])
+        record_data = RecordData.from_dataframe(dataframe)
+        dataframe.itertuples.assert_called_once_with(index=False, name=None)
+        self.assertEqual(record_data.field_names, ['foo', 'bar'])
+        self.assertEqual(record_data.records, [(1, 2), (3, 4)])
+
+    def test_from_dataframe_sends_missing_values_as_None(self):
+        class NA(object):
+            """ Stands in for pandas.NA, whose comparisons have no truth value """
+            def __ne__(self, other):
+                return self
+
+            def __bool__(self):
+                raise TypeError('boolean value of NA is ambiguous')
+
+        dataframe = Mock(columns=['foo', 'bar', 'baz'])
+        dataframe.itertuples.return_value = iter([(1, float('nan'), NA()), (0.0, 'a', None)])
+        record_data = RecordData.from_dataframe(dataframe)
+        self.assertEqual(record_data.records, [(1, None, None), (0.0, 'a', None)])
+
+    def test_from_soap_type_reads_field_values_in_field_name_order(self):
+        soap_record_data = SimpleNamespace(
+            fieldNames=['foo', 'bar'], records=[SimpleNamespace(fieldValues=[1, 2])])
+        record_data = RecordData.from_soap_type(soap_record_data)
+        self.assertEqual(record_data.field_names, ['foo', 'bar'])
+        self.assertEqual(record_data.records, [(1, 2)])
+
+
+class RecordDataFromXmlTests(unittest.TestCase):
+    replies = {'recordData': RETRIEVE_REPLY, 'result': RETRIEVE_TABLE_REPLY}
+
+    def test_sets_field_names_from_reply(self):
+        for name, reply in self.replies.items():
+            with self.subTest(name):
+                record_data = RecordData.from_xml(reply)
+                self.assertEqual(record_data.field_names, ['EMAIL_ADDRESS_', 'CITY_'])
+
+    def test_sets_record_values_from_reply(self):
+        for name, reply in self.replies.items():
+            with self.subTest(name):
+                record_data = RecordData.from_xml(reply)
+                self.assertEqual(
+                    record_data.records, [('a@example.com', 'Paris'), ('b@example.com', None)])
+
+
+class RecordDataIterXmlTests(unittest.TestCase):
+    def test_yields_dictionary_per_record(self):
+        for reply in (RETRIEVE_REPLY, RETRIEVE_TABLE_REPLY):
+            with self.subTest(reply=reply):
+                self.assertEqual(list(RecordData.iter_xml(reply)), [
+                    {'EMAIL_ADDRESS_': 'a@example.com', 'CITY_': 'Paris'},
+                    {'EMAIL_ADDRESS_': 'b@example.com', 'CITY_': None},
+                ])
+
+    def test_drops_record_elements_once_read(self):
+        parsers = []
+        parse = ElementTree.iterparse
+
+        def iterparse(*args, **kwargs):
+            parsers.append(parse(*args, **kwargs))
+            return parsers[-1]
+
+        for reply in (RETRIEVE_REPLY, RETRIEVE_TABLE_REPLY):
+            with self.subTest(reply=reply), patch.object(ElementTree, 'iterparse', iterparse):
+                list(RecordData.iter_xml(reply))
+                records = parsers[-1].root.iter('{urn:ws.rsys.com}records')
+                self.assertEqual(list(records), [])
+
+
+class ResultTypeTests(unittest.TestCase):
+    def setUp(self):
+        self.soap_result = SimpleNamespace(recipientId=1, errorMessage=None)
+        self.result = RecipientResult(self.soap_result)
+
+    def test_reads_attribute_from_soap_result_once(self):
+        self.assertEqual(self.result.recipient_id, 1)
+        self.soap_result.recipientId = 2
+        self.assertEqual(self.result.recipient_id, 1)
+
+    def test_raises_AttributeError_for_undeclared_attribute(self):
+        with self.assertRaises(AttributeError):
+            self.result.success
+
+    def test_copies_unread_attributes(self):
+        self.assertEqual(deepcopy(self.result).recipient_id, 1)
+
+
+class SoapObjectTests(FactoryClientTestCase):
+    def test_custom_event_soap_object_has_event_attributes(self):
+        soap_object = CustomEvent('event', 1, 'strings').get_soap_object(self.client)
+        self.assertEqual(soap_object.eventName, 'event')
+        self.assertEqual(soap_object.eventId, 1)
+        self.assertEqual(soap_object.eventStringDataMapping, 'strings')
+        self.assertIsNone(soap_object.eventNumberDataMapping)
+
+    def test_recipient_soap_object_has_soap_list_name(self):
+        recipient = Recipient(InteractObject('folder', 'list'), customer_id=1)
+        soap_object = recipient.get_soap_object(self.client)
+        self.assertEqual(soap_object.customerId, 1)
+        self.assertEqual(soap_object.emailFormat, Recipient.EmailFormats.TEXT)
+        self.assertEqual(soap_object.listName.objectName, 'list')
+
+
+class RecipientTests(unittest.TestCase):
+    def test_requires_an_identifier(self):
+        with self.assertRaises(AssertionError):
+            Recipient(InteractObject('folder', 'list'))
+
+
+class RecipientDataTests(unittest.TestCase):
+    def test_wraps_optional_data(self):
+        recipient_data = RecipientData(Mock(), {'one': 1})
+        self.assertIsInstance(recipient_data.optional_data, OptionalData)
+        self.assertEqual(recipient_data.optional_data, {'one': 1})
+
+    def test_defaults_to_empty_optional_data(self):
+        self.assertEqual(RecipientData(Mock()).optional_data, OptionalData())
+
+
+class OptionalDataTests(FactoryClientTestCase):
+    def test_is_empty_without_data(self):
+        self.assertEqual(OptionalData(), {})
+        self.assertEqual(OptionalData(None), {})
+
+    def test_get_soap_object_builds_name_value_pair_per_item(self):
+        soap_objects = OptionalData({'one': 1}).get_soap_object(self.client)
+        self.assertEqual([(o.name, o.value) for o in soap_objects], [('one', 1)])
+
+    def test_get_soap_object_returns_None_without_data(self):
+        self.assertIsNone(OptionalData().get_soap_object(self.client))
 
 
 class MergeResultTests(unittest.TestCase):
     def setUp(self):
         self.error_message = 'These failed: Record 1 = Test, Record 2 = What'
-        self.merge_result = MergeResult(Mock(
+        self.merge_result = MergeResult(SimpleNamespace(
             insertCount=1,
             updateCount=1,
             rejectedCount=2,
@@ -155,3 +460,15 @@ class MergeResultTests(unittest.TestCase):
 
     def test_failed_property_returns_list_of_ids_from_error_string(self):
         self.assertEqual(self.merge_result.failed, [1, 2])
+
+    def test_failed_property_returns_empty_list_without_error_message(self):
+        merge_result = MergeResult(SimpleNamespace(errorMessage=None))
+        self.assertEqual(merge_result.failed, [])
+
+    def test_failed_property_returns_record_zero_as_integer(self):
+        merge_result = MergeResult(SimpleNamespace(errorMessage='Record 0 = Test'))
+        self.assertEqual(merge_result.failed, [0])
+
+    def test_failed_property_parses_error_message_once(self):
+        failed = self.merge_result.failed
+        self.assertIs(self.merge_result.failed, failed)
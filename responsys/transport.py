@@ -0,0 +1,82 @@
+from http.client import OK
+from io import BytesIO
+from urllib.request import urlopen
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+from suds.transport import Transport, TransportError, Reply
+from urllib3.util.retry import Retry
+
+
+class PooledTransport(Transport):
+
+    """ Pooled Transport Class
+
+    suds' default transport opens a new connection for every request it makes. This transport sends
+    requests through a requests.Session instead, so TCP/TLS connections to the Responsys service
+    are kept alive and reused across calls:
+
+        >>> Client(wsdl, transport=PooledTransport())
+
+    Transports created with the same session share its connection pool and cookies. Sessions
+    created with the same adapter share only the connection pool:
+
+        >>> adapter = PooledTransport.create_adapter()
+        >>> Client(wsdl, transport=PooledTransport(PooledTransport.create_session(adapter)))
+    """
+    POOL_CONNECTIONS = 4
+    POOL_MAXSIZE = 20
+    MAX_RETRIES = Retry(total=3, backoff_factor=0.3)
+
+    def __init__(self, session=None):
+        super().__init__()
+        self.session = self.create_session() if session is None else session
+
+    @classmethod
+    def create_adapter(cls):
+        """ Create a requests HTTPAdapter holding a pool of connections """
+        return HTTPAdapter(
+            pool_connections=cls.POOL_CONNECTIONS,
+            pool_maxsize=cls.POOL_MAXSIZE,
+            max_retries=cls.MAX_RETRIES,
+        )
+
+    @classmethod
+    def create_session(cls, adapter=None):
+        """ Create a requests.Session pooling connections for http and https urls
+
+        Connections are pooled by the adapter provided, or by a new one when None.
+        """
+        session = Session()
+        if adapter is None:
+            adapter = cls.create_adapter()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def request(self, method, request, data=None):
+        """ Makes an http request for the suds request provided
+
+        Raises TransportError for any response other than 200 OK, which suds uses to handle faults
+        and empty (202/204) replies.
+        """
+        response = self.session.request(
+            method, request.url, data=data, headers=request.headers,
+            timeout=request.timeout or self.options.timeout)
+        if response.status_code != OK:
+            raise TransportError(response.reason, response.status_code, BytesIO(response.content))
+        return response
+
+    def open(self, request):
+        """ Opens the url of the request provided, used by suds to fetch WSDL and schema files
+
+        Urls other than http(s), such as those of local WSDL files, are opened with urllib.
+        """
+        if not request.url.startswith(('http://', 'https://')):
+            return urlopen(request.url)
+        return BytesIO(self.request('GET', request).content)
+
+    def send(self, request):
+        """ Sends the soap message of the request provided, returns a suds Reply """
+        response = self.request('POST', request, data=request.message)
+        return Reply(response.status_code, response.headers, response.content)
@@ -1,66 +1,171 @@
 import re
-from collections import UserDict
+import sys
+from collections import namedtuple
+from copy import copy
+from functools import lru_cache
+from io import BytesIO
+from operator import itemgetter
+from weakref import WeakKeyDictionary
+from xml.etree import ElementTree
+
+from suds.sudsobject import Object
+
+# Numbers of the records listed in a MergeResult error message
+_FAILED_RECORD = re.compile(r'Record (\d+) =')
+
+# Stands in for attributes missing from the other side of a comparison
+_MISSING = object()
+
+# Prototype soap objects by type name, per suds client factory
+_prototypes = WeakKeyDictionary()
+
+
+def create_soap_object(client, name):
+    """ Create a soap object of the WSDL type named, using the client factory
+
+    The suds factory walks the schema to build every new object, so the first object built for a
+    type is kept as a prototype and shallow copies of it are returned from then on. Attributes
+    holding nested objects should be replaced on the copy rather than mutated.
+    """
+    prototypes = _prototypes.setdefault(client.factory, {})
+    if name not in prototypes:
+        prototypes[name] = client.factory.create(name)
+    soap_object = copy(prototypes[name])
+    if isinstance(soap_object, Object):
+        # suds objects keep their attribute names in a list, the copy needs its own
+        soap_object.__keylist__ = soap_object.__keylist__[:]
+    return soap_object
+
+
+@lru_cache(maxsize=None)
+def to_soap_attribute(attr):
+    """ Convert a snake_case attribute name to the camelCase name used by the WSDL
+
+    The names come from a small fixed set, so each conversion is cached. The results are interned
+    as they are used as attribute names on every soap object built.
+    """
+    words = attr.split('_')
+    words = words[:1] + [word.capitalize() for word in words[1:]]
+    return sys.intern(''.join(words))
+
+
+def _iter_xml_records(xml, field_names):
+    """ Iterate the values of each record in the xml of a soap reply, as tuples
+
+    Field names are appended to the list provided as they are read, they precede the records.
+    """
+    # Elements open at the current point of the parse, the last is the parent of the next
+    parents = []
+    for event, element in ElementTree.iterparse(BytesIO(xml), events=('start', 'end')):
+        if event == 'start':
+            parents.append(element)
+            continue
+        parents.pop()
+        name = element.tag.rpartition('}')[2]
+        if name == 'fieldNames':
+            field_names.append(element.text)
+        elif name == 'records':
+            yield tuple([value.text for value in element])
+            parents[-1].remove(element)
+
+
+def _is_missing(value):
+    """ Whether the value is a missing pandas value: NaN, NaT or pandas.NA """
+    # NaN and NaT are unequal to themselves, pandas.NA compares to NA which has no truth value
+    try:
+        return bool(value != value)
+    except TypeError:
+        return True
+
+
+@lru_cache(maxsize=128)
+def _row_type(field_names):
+    """ Create a named tuple type for records of the field names, also indexable by field name """
+    index = {name: i for i, name in enumerate(field_names)}
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            key = index[key]
+        return tuple.__getitem__(self, key)
+
+    base = namedtuple('Row', field_names, rename=True)
+    return type('Row', (base,), {'__slots__': (), '__getitem__': __getitem__})
 
 
 class InteractType(object):
 
     """ InteractType class
 
-    Provides base interact type functionality. Interact types should register their WSDL defined
-    attributes via the soap_attribute method. This allows interact types to provide their own
-    soap friendly objects for use with the suds client used by the InteractClient.
+    Provides base interact type functionality. Interact types declare their WSDL defined
+    attributes in __slots__ and set them via the soap_attribute method. This allows interact types
+    to provide their own soap friendly objects for use with the suds client used by the
+    InteractClient. Slots starting with an underscore are private and not sent. Subclasses must
+    declare __slots__, even if empty, otherwise a TypeError is raised.
 
     Interact type attributes can be accessed via dictionary lookup, for example:
 
-        >>> InteractType(foo=1)
-        >>> InteractType['foo'] == InteractType.foo
+        >>> class Fish(InteractType):
+        ...     __slots__ = ('foo',)
+        >>> Fish(foo=1)['foo'] == Fish(foo=1).foo
         ... True
     """
 
+    __slots__ = ()
+
+    # The WSDL defined name for this class, the class name unless set in the class body
+    soap_name = 'InteractType'
+
+    # (attribute, WSDL defined name) for each declared soap attribute, set per class
+    _soap_pairs = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Without __slots__ instances get a __dict__, which would silently accept and then drop
+        # undeclared attributes
+        if '__slots__' not in vars(cls):
+            raise TypeError('{} must declare __slots__'.format(cls.__name__))
+        if 'soap_name' not in vars(cls):
+            cls.soap_name = cls.__name__
+        attributes = [
+            attr for klass in reversed(cls.__mro__) for attr in vars(klass).get('__slots__', ())
+            if not attr.startswith('_')]
+        cls._soap_pairs = tuple((attr, to_soap_attribute(attr)) for attr in attributes)
+
     def __init__(self, *args, **kwargs):
-        self._attributes = set()
         self.set_attributes(*args, **kwargs)
 
     def __getitem__(self, name):
         return getattr(self, name)
 
-    @property
-    def soap_name(self):
-        """ Provide the WSDL defined name for this class. """
-        return self.__class__.__name__
-
     def soap_attribute(self, name, value):
-        """ Marks an attribute as being a part of the data defined by the soap datatype"""
+        """ Sets an attribute declared as being a part of the data defined by the soap datatype"""
         setattr(self, name, value)
-        self._attributes.add(name)
 
     def get_soap_object(self, client):
         """ Create and return a soap service type defined for this instance """
-        def to_soap_attribute(attr):
-            words = attr.split('_')
-            words = words[:1] + [word.capitalize() for word in words[1:]]
-            return ''.join(words)
-
-        soap_object = client.factory.create(self.soap_name)
-        for attr in self._attributes:
-            value = getattr(self, attr)
-            setattr(soap_object, to_soap_attribute(attr), value)
+        soap_object = create_soap_object(client, self.soap_name)
+        for attr, soap_attr in self._soap_pairs:
+            setattr(soap_object, soap_attr, getattr(self, attr))
 
         return soap_object
 
     def set_attributes(self, *args, **kwargs):
-        for name, value in list(kwargs.items()):
+        for name, value in kwargs.items():
             self.soap_attribute(name, value)
 
     def __eq__(self, a):
-        attr_equal = lambda attr: getattr(self, attr) == getattr(a, attr)
-        return all([attr_equal(attr) for attr in self._attributes])
+        if not isinstance(a, InteractType):
+            return NotImplemented
+        return all(
+            getattr(self, attr) == getattr(a, attr, _MISSING) for attr, _ in self._soap_pairs)
 
 
 class InteractObject(InteractType):
 
     """ Responsys InteractObject Type """
 
+    __slots__ = ('folder_name', 'object_name')
+
     def set_attributes(self, folder_name, object_name):
         self.soap_attribute('folder_name', folder_name)
         self.soap_attribute('object_name', object_name)
@@ -89,6 +194,11 @@ class ListMergeRule(InteractType):
     these options do.
     """
 
+    __slots__ = (
+        'insert_on_no_match', 'update_on_match', 'match_column_name_1', 'match_column_name_2',
+        'match_column_name_3', 'match_operator', 'optin_value', 'optout_value', 'html_value',
+        'text_value', 'reject_record_if_channel_empty', 'default_permission_status')
+
     DEFAULTS = {
         'insert_on_no_match': True,
         'update_on_match': 'REPLACE_ALL',
@@ -105,22 +215,8 @@ class ListMergeRule(InteractType):
     }
 
     def set_attributes(self, **overrides):
-        options = self.DEFAULTS.copy()
-        options.update(overrides)
-
-        self.soap_attribute('insert_on_no_match', options['insert_on_no_match'])
-        self.soap_attribute('update_on_match', options['update_on_match'])
-        self.soap_attribute('match_column_name_1', options['match_column_name_1'])
-        self.soap_attribute('match_column_name_2', options['match_column_name_2'])
-        self.soap_attribute('match_column_name_3', options['match_column_name_3'])
-        self.soap_attribute('match_operator', options['match_operator'])
-        self.soap_attribute('optin_value', options['optin_value'])
-        self.soap_attribute('optout_value', options['optout_value'])
-        self.soap_attribute('html_value', options['html_value'])
-        self.soap_attribute('text_value', options['text_value'])
-        self.soap_attribute(
-            'reject_record_if_channel_empty', options['reject_record_if_channel_empty'])
-        self.soap_attribute('default_permission_status', options['default_permission_status'])
+        for name, default in self.DEFAULTS.items():
+            self.soap_attribute(name, overrides.get(name, default))
 
 
 class RecordData(InteractType):
@@ -128,37 +224,101 @@ class RecordData(InteractType):
     """ Responsys RecordData Type
 
     Responsys type representing a mapping of field names to values. Accepts a list of dictionary
-    like objects for init.
+    like objects for init, or a list of value sequences along with the field_names they are
+    ordered by:
+
+        >>> RecordData([{'EMAIL_ADDRESS_': 'a@example.com', 'CITY_': 'Paris'}])
+        >>> RecordData([('a@example.com', 'Paris')], field_names=['EMAIL_ADDRESS_', 'CITY_'])
     """
 
+    __slots__ = ('field_names', 'records')
+
     @classmethod
     def from_soap_type(cls, record_data):
-        record_data = [
-            dict(zip(record_data.fieldNames, r.fieldValues)) for r in record_data.records]
-        return cls(record_data)
+        records = [r.fieldValues for r in record_data.records]
+        return cls(records, field_names=record_data.fieldNames)
 
-    def set_attributes(self, record_data):
-        assert len(record_data), "Record list length must be non-zero"
-        field_names = list(record_data[0].keys())
+    @classmethod
+    def from_dataframe(cls, dataframe):
+        """ Create from a pandas DataFrame, one record per row
+
+        Rows are read as tuples in column order rather than converted to a dictionary each. Missing
+        values are sent as None, suds would send NaN as the text "nan". pandas is not required, any
+        object providing columns and itertuples will do.
+        """
+        records = [
+            tuple(None if _is_missing(value) else value for value in row)
+            for row in dataframe.itertuples(index=False, name=None)]
+        return cls(records, field_names=dataframe.columns)
 
-        records = []
-        for record in record_data:
-            records.append([record[field_name] for field_name in field_names])
+    @classmethod
+    def from_xml(cls, xml):
+        """ Create from the xml of a soap reply containing field names and records
+
+        Parses with ElementTree's C parser, avoiding suds' unmarshalling of large replies.
+        """
+        field_names = []
+        records = list(_iter_xml_records(xml, field_names))
+        return cls(records, field_names=field_names)
+
+    @staticmethod
+    def iter_xml(xml):
+        """ Iterate the records in the xml of a soap reply containing field names and records
+
+        Yields a dictionary of field names to values per record. The reply is parsed incrementally
+        and each record element is dropped from the tree once read, so although the reply itself
+        stays in memory its records are not all parsed into elements at once.
+        """
+        field_names = []
+        for values in _iter_xml_records(xml, field_names):
+            yield dict(zip(field_names, values))
+
+    def set_attributes(self, record_data, field_names=None):
+        assert len(record_data), "Record list length must be non-zero"
+        # Records are kept as tuples, which suds marshals just like lists
+        if field_names is not None:
+            field_names = list(field_names)
+            records = [tuple(record) for record in record_data]
+        else:
+            field_names = list(record_data[0].keys())
+            if len(field_names) == 1:
+                field_name, = field_names
+                records = [(record[field_name],) for record in record_data]
+            else:
+                records = list(map(itemgetter(*field_names), record_data))
 
         self.soap_attribute('field_names', field_names)
         self.soap_attribute('records', records)
 
     def __iter__(self):
+        field_names = self.field_names
         for record in self.records:
-            yield dict(zip(self.field_names, record.field_values))
+            yield dict(zip(field_names, record))
+
+    def rows(self):
+        """ Iterate the records as named tuples
+
+        Lighter to build than the dictionaries yielded by iterating, values can be read by field
+        name as from a dictionary or as attributes. Field names that are not valid identifiers are
+        only available by name lookup.
+        """
+        return map(_row_type(tuple(self.field_names))._make, self.records)
 
     def __len__(self):
         return len(self.records)
 
     def get_soap_object(self, client):
-        """ Override default get_soap_object behavior to account for child Record types """
+        """ Override default get_soap_object behavior to account for child Record types
+
+        Soap records are built straight from the stored rows, without a Record instance per row.
+        """
         record_data = super().get_soap_object(client)
-        record_data.records = [Record(r).get_soap_object(client) for r in record_data.records]
+        records = []
+        for field_values in self.records:
+            record = create_soap_object(client, 'Record')
+            record.fieldValues = field_values
+            records.append(record)
+        record_data.records = records
         return record_data
 
 
@@ -169,72 +329,107 @@ class Record(InteractType):
     A record is a series of values. Can be iterated over and has a length.
     """
 
+    __slots__ = ('field_values',)
+
     def set_attributes(self, record):
-        field_values = list(record)
+        # A list is kept as given rather than copied
+        field_values = record if type(record) is list else list(record)
         self.soap_attribute('field_values', field_values)
 
     def __iter__(self):
-        return (v for v in self.field_values)
+        return iter(self.field_values)
 
     def __len__(self):
         return len(self.field_values)
 
 
-class DeleteResult(InteractType):
+class ResultType(InteractType):
+
+    """ ResultType class
+
+    Base for types wrapping a result returned by the soap service. Declared attributes are read
+    from the wrapped soap object on first access rather than copied when the result is created,
+    as callers of bulk calls often only check one or two of them.
+    """
+
+    __slots__ = ('_result',)
+
+    # WSDL defined name by attribute, set per class
+    _soap_names = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._soap_names = dict(cls._soap_pairs)
+
+    def set_attributes(self, result):
+        self._result = result
+
+    def __getattr__(self, name):
+        # Only called for attributes not set yet
+        soap_name = self._soap_names.get(name)
+        if soap_name is None:
+            raise AttributeError(name)
+        value = getattr(self._result, soap_name)
+        setattr(self, name, value)
+        return value
+
+
+class DeleteResult(ResultType):
     """ Responsys DeleteResult Type """
+
+    __slots__ = ('error_message', 'success', 'exception_code', 'id')
+
     def set_attributes(self, delete_result):
-        self.soap_attribute('error_message', delete_result.errorMessage)
-        self.soap_attribute('success', delete_result.success)
-        self.soap_attribute('exception_code', delete_result.exceptionCode)
-        self.soap_attribute('id', delete_result.id)
+        super().set_attributes(delete_result)
+
 
+class LoginResult(ResultType):
+    __slots__ = ('session_id',)
 
-class LoginResult(InteractType):
     def set_attributes(self, login_result):
-        self.soap_attribute('session_id', login_result.sessionId)
+        super().set_attributes(login_result)
+
 
+class MergeResult(ResultType):
+    __slots__ = (
+        'insert_count', 'update_count', 'rejected_count', 'total_count', 'error_message',
+        '_failed')
 
-class MergeResult(InteractType):
     def set_attributes(self, merge_result):
-        self.soap_attribute('insert_count', merge_result.insertCount)
-        self.soap_attribute('update_count', merge_result.updateCount)
-        self.soap_attribute('rejected_count', merge_result.rejectedCount)
-        self.soap_attribute('total_count', merge_result.totalCount)
-        self.soap_attribute('error_message', merge_result.errorMessage)
+        super().set_attributes(merge_result)
 
     @property
     def failed(self):
-        failed = None
-        if self.error_message:
-            failed = re.findall(r'Record ([0-9]*) =', self.error_message)
-            failed = [f.isnumeric() and int(f) or f for f in failed]
+        """ Numbers of the records that failed to merge, parsed from error_message once """
+        try:
+            return self._failed
+        except AttributeError:
+            failed = []
+            if self.error_message:
+                failed = [
+                    int(match.group(1)) for match in _FAILED_RECORD.finditer(self.error_message)]
+            self._failed = failed
+            return failed
 
-        return failed or []
 
+class RecipientResult(ResultType):
+    __slots__ = ('recipient_id', 'error_message')
 
-class RecipientResult(InteractType):
     def set_attributes(self, recipient_result):
-        self.soap_attribute('recipient_id', recipient_result.recipientId)
-        self.soap_attribute('error_message', recipient_result.errorMessage)
+        super().set_attributes(recipient_result)
 
 
-class ServerAuthResult(InteractType):
+class ServerAuthResult(ResultType):
+    __slots__ = ('auth_session_id', 'encrypted_client_challenge', 'server_challenge')
+
     def set_attributes(self, server_auth_result):
-        self.soap_attribute('auth_session_id', server_auth_result.authSessionId)
-        self.soap_attribute(
-            'encrypted_client_challenge', server_auth_result.encryptedClientChallenge)
-        self.soap_attribute('server_challenge', server_auth_result.serverChallenge)
+        super().set_attributes(server_auth_result)
 
 
 class CustomEvent(InteractType):
-    def get_soap_object(self, client):
-        custom_event = client.factory.create(self.soap_name)
-        custom_event.eventName = self.event_name
-        custom_event.eventId = self.event_id
-        custom_event.eventStringDataMapping = self.event_string_data_mapping
-        custom_event.eventDateDataMapping = self.event_date_data_mapping
-        custom_event.eventNumberDataMapping = self.event_number_data_mapping
-        return custom_event
+    __slots__ = (
+        'event_name', 'event_id', 'event_string_data_mapping', 'event_date_data_mapping',
+        'event_number_data_mapping')
 
     def set_attributes(self, event_name, event_id, event_string_data_mapping=None,
             event_date_data_mapping=None, event_number_data_mapping=None):
@@ -246,6 +441,10 @@ class CustomEvent(InteractType):
 
 
 class Recipient(InteractType):
+    __slots__ = (
+        'list_name', 'recipient_id', 'customer_id', 'email_address', 'mobile_number',
+        'email_format')
+
     class EmailFormats(object):
         TEXT = 'TEXT_FORMAT'
         HTML = 'HTML_FORMAT'
@@ -253,20 +452,15 @@ class Recipient(InteractType):
         NONE = 'NO_FORMAT'
 
     def get_soap_object(self, client):
-        recipient = client.factory.create(self.soap_name)
+        recipient = super().get_soap_object(client)
         recipient.listName = self.list_name.get_soap_object(client)
-        recipient.recipientId = self.recipient_id
-        recipient.customerId = self.customer_id
-        recipient.emailAddress = self.email_address
-        recipient.mobileNumber = self.mobile_number
-        recipient.emailFormat = self.email_format
         return recipient
 
     def set_attributes(
             self, list_name, recipient_id=None, customer_id=None,
             email_address=None, mobile_number=None, email_format=EmailFormats.TEXT):
 
-        assert any([recipient_id, customer_id, email_address, mobile_number]), (
+        assert recipient_id or customer_id or email_address or mobile_number, (
             "At least one of recipient_id, customer_id, mobile_number, or email_address must be "
             "provided")
         self.soap_attribute('list_name', list_name)
@@ -278,30 +472,37 @@ class Recipient(InteractType):
 
 
 class RecipientData(InteractType):
+    __slots__ = ('recipient', 'optional_data')
+
     def set_attributes(self, recipient, optional_data=None):
         self.soap_attribute('recipient', recipient)
-        self.soap_attribute('optional_data', OptionalData(optional_data) or OptionalData({}))
+        self.soap_attribute('optional_data', OptionalData(optional_data))
 
     def get_soap_object(self, client):
-        recipient_data = client.factory.create(self.soap_name)
+        recipient_data = create_soap_object(client, self.soap_name)
         recipient_data.optionalData = self.optional_data.get_soap_object(client)
         recipient_data.recipient = self.recipient.get_soap_object(client)
         return recipient_data
 
 
-class OptionalData(UserDict, InteractType):
+class OptionalData(dict, InteractType):
+    __slots__ = ()
+
+    def __init__(self, data=None):
+        super().__init__(data or ())
+
     def get_soap_object(self, client):
         optional_data_list = []
         for name, value in self.items():
-            optional_data = client.factory.create(self.soap_name)
+            optional_data = create_soap_object(client, self.soap_name)
             optional_data.name = name
             optional_data.value = value
             optional_data_list.append(optional_data)
         return optional_data_list or None
 
 
-class TriggerResult(InteractType):
+class TriggerResult(ResultType):
+    __slots__ = ('recipient_id', 'success', 'error_message')
+
     def set_attributes(self, trigger_result):
-        self.soap_attribute('recipient_id', trigger_result.recipientId)
-        self.soap_attribute('success', trigger_result.success)
-        self.soap_attribute('error_message', trigger_result.errorMessage)
+        super().set_attributes(trigger_result)
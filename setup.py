@@ -8,7 +8,8 @@ with open(path.join(project_dir, 'README.md')) as f:
     long_description = f.read()
 
 install_requires = (
-    'suds-jurko'
+    'requests',
+    'suds',
 )
 tests_require = (
     'coverage',
@@ -28,6 +29,7 @@ setup(
     description='Python client library for the Responsys Interact API',
     long_description=long_description,
     packages=find_packages(),
+    package_data={'responsys.tests': ['*.wsdl']},
     license='GPLv2',
     install_requires=install_requires,
     setup_requires=tests_require,